@@ -97,7 +97,7 @@ class Classifier(nn.Module):
             [Optionally: Y_s: An [n, k] np.ndarray of predicted probabilities]
         """
         Y_s = self._to_numpy(self.predict_proba(X, **kwargs))
-        Y_p = self._break_ties(Y_s, break_ties).astype(np.int)
+        Y_p = self._break_ties(Y_s, break_ties).astype(int)
         if return_probs:
             return Y_p, Y_s
         else:
@@ -1,8 +1,71 @@
+import os
+from functools import partial
+
+import numpy as np
 import torch
+from torch.utils.data import DataLoader
 
 from metal.mmtl.data import MmtlDataLoader, MmtlDataset
 
 
+def _stack_labels(label_fn, batch):
+    """Collates a batch of dataset items into their stacked labels
+
+    Module-level (rather than a closure) so it stays picklable when DataLoader
+    workers are started via spawn.
+    """
+    return torch.stack([label_fn(x) for x in batch], dim=0)
+
+
+def _apply_njit_label_fn(dataset, njit_label_fn):
+    """Applies a numba-compiled per-item label fn over a dataset in parallel
+
+    njit_label_fn should be a numba.njit-compiled function (X, i) -> ndarray
+    mapping item i of the dataset's single data field (viewed as a NumPy
+    array X) to its label. The driver loop is itself compiled with
+    parallel=True, so each iteration costs a few compiled ops instead of a
+    Python frame and the loop runs across cores.
+    """
+    try:
+        from numba import config, njit, prange
+    except ImportError:
+        raise ImportError(
+            "add_labelset's njit_label_fn argument requires numba; "
+            "install it with `pip install numba`."
+        )
+
+    # Default to numba's self-contained workqueue threading layer unless the
+    # user has picked one explicitly: the tbb layer (numba's first choice when
+    # installed) can deadlock interpreter shutdown when loaded in-process
+    # alongside other native thread pools
+    if "NUMBA_THREADING_LAYER" not in os.environ:
+        config.THREADING_LAYER = "workqueue"
+
+    if len(dataset.X_dict) != 1:
+        raise ValueError("njit_label_fn requires a dataset with a single data field")
+    X = next(iter(dataset.X_dict.values()))
+    if not isinstance(X, torch.Tensor):
+        raise ValueError("njit_label_fn requires the data field to be a Tensor")
+    X = X.cpu().numpy()
+    if X.shape[0] == 0:
+        raise ValueError(
+            "njit_label_fn cannot infer a label shape from an empty dataset"
+        )
+
+    # Infer the label shape/dtype from the first item, then fill a
+    # preallocated array that torch can wrap zero-copy
+    probe = np.asarray(njit_label_fn(X, 0))
+    out = np.empty((X.shape[0], *probe.shape), dtype=probe.dtype)
+
+    @njit(parallel=True)
+    def _fill(X, out):
+        for i in prange(X.shape[0]):
+            out[i] = njit_label_fn(X, i)
+
+    _fill(X, out)
+    return torch.from_numpy(out)
+
+
 class Payload(object):
     """A bundle of data_loaders...
 
@@ -39,14 +102,34 @@ class Payload(object):
 
         X and Y will be packaged into an MmtlDataset that will be wrapped in an
         MmtlDataLoader.
+
+        If a cuda device is available, batches are loaded into pinned memory by
+        default (pass pin_memory=False to opt out) so that the host-to-device
+        copy of each batch can be made non-blocking.
+
+        If num_workers > 0, persistent_workers defaults to True so that worker
+        processes survive across epochs instead of being respawned, and
+        prefetch_factor defaults to 2; pass either explicitly to override.
         """
+        if torch.cuda.is_available():
+            data_loader_kwargs.setdefault("pin_memory", True)
+        if data_loader_kwargs.get("num_workers", 0) > 0:
+            data_loader_kwargs.setdefault("persistent_workers", True)
+            data_loader_kwargs.setdefault("prefetch_factor", 2)
         dataset = MmtlDataset(X, Y)
         data_loader = MmtlDataLoader(dataset, **data_loader_kwargs)
         labels_to_tasks = {"labels": task_name}
         return Payload(name, data_loader, labels_to_tasks, split)
 
     def add_labelset(
-        self, task_name, label_name, label_list=None, label_fn=None, verbose=True
+        self,
+        task_name,
+        label_name,
+        label_list=None,
+        label_fn=None,
+        batched_label_fn=None,
+        njit_label_fn=None,
+        verbose=True,
     ):
         """Adds a new labelset to an existing payload
 
@@ -54,18 +137,64 @@ class Payload(object):
             task_name: the name of the Task to which the labelset belongs
             label_name: the name of the labelset being added
             label_fn: a function which maps a dataset item to a label
-                labels will be combined using torch.stack(labels, dim=0)
+            batched_label_fn: a function which maps the entire dataset to a
+                label Tensor of shape [n, ?] in a single call; use this when
+                the labels can be computed with vectorized Tensor ops instead
+                of one Python call per item
+            njit_label_fn: a numba.njit-compiled function (X, i) -> ndarray
+                mapping item i of the dataset's single data field to its
+                label; use this for pure-numeric projections, which then run
+                as a compiled parallel loop (requires numba)
             label_list: a list of labels in the correct order
 
-        Note that either label_fn or label_list should be provided, but not both.
+        Note that exactly one of label_fn, batched_label_fn, njit_label_fn, or
+        label_list should be provided.
         """
 
-        if label_fn is not None:
+        if batched_label_fn is not None:
+            assert label_list is None and label_fn is None and njit_label_fn is None
+            assert callable(batched_label_fn)
+            new_labels = batched_label_fn(self.data_loader.dataset)
+        elif njit_label_fn is not None:
+            assert label_list is None and label_fn is None
+            assert callable(njit_label_fn)
+            new_labels = _apply_njit_label_fn(self.data_loader.dataset, njit_label_fn)
+        elif label_fn is not None:
             assert label_list is None
             assert callable(label_fn)
-            new_labels = torch.stack(
-                [label_fn(x) for x in self.data_loader.dataset], dim=0
-            )
+            dataset = self.data_loader.dataset
+            num_workers = getattr(self.data_loader, "num_workers", 0)
+            if num_workers > 0:
+                # Run label_fn inside worker processes (mirroring the payload's
+                # own loader) so per-item work parallelizes; the main process
+                # only pays for the final concatenation
+                tmp_loader = DataLoader(
+                    dataset,
+                    batch_size=256,
+                    num_workers=num_workers,
+                    collate_fn=partial(_stack_labels, label_fn),
+                )
+                new_labels = torch.cat(list(tmp_loader), dim=0)
+            else:
+                # Infer the label shape/dtype/device from the first item, then
+                # fill a preallocated Tensor rather than stacking n
+                # intermediate Tensors
+                first = label_fn(dataset[0])
+                new_labels = torch.empty(
+                    (len(dataset), *first.shape),
+                    dtype=first.dtype,
+                    device=first.device,
+                )
+                new_labels[0] = first
+                for i in range(1, len(dataset)):
+                    label = label_fn(dataset[i])
+                    if label.shape != first.shape:
+                        raise ValueError(
+                            f"label_fn must return labels of a uniform shape: "
+                            f"got {tuple(label.shape)} for item {i}, expected "
+                            f"{tuple(first.shape)}"
+                        )
+                    new_labels[i] = label
         elif label_list is not None:
             assert label_fn is None
             assert isinstance(label_list, torch.Tensor)
@@ -76,19 +205,37 @@ class Payload(object):
         if new_labels.dim() < 2:
             raise Exception("New labelset must have at least two dimensions: [n, ?]")
 
-        self.data_loader.dataset.labels[task_name] = new_labels
+        # If the dataset's existing labelsets live in pinned memory, pin the
+        # new one too so every labelset stays on the fast non-blocking
+        # host-to-device path (mixed pinned/pageable storage silently stalls
+        # the transfer of each batch)
+        if (
+            new_labels.device.type == "cpu"
+            and not new_labels.is_pinned()
+            and any(
+                isinstance(t, torch.Tensor) and t.is_pinned()
+                for t in self.data_loader.dataset.Y_dict.values()
+            )
+        ):
+            new_labels = new_labels.pin_memory()
+
+        self.data_loader.dataset.Y_dict[label_name] = new_labels
         self.labels_to_tasks[label_name] = task_name
 
         if verbose:
-            active = torch.any(new_labels != 0, dim=1)
+            # count_nonzero lowers to a single reduction kernel (any() over a
+            # non-bool Tensor first materializes an elementwise comparison),
+            # and the only host sync is the final scalar conversion
+            row_nnz = new_labels.count_nonzero(dim=1)
+            num_active = int((row_nnz > 0).sum())
             msg = (
-                f"Added labelset with {sum(active.long())}/{len(active)} labels for "
+                f"Added labelset with {num_active}/{new_labels.shape[0]} labels for "
                 f"task {task_name} to payload {self.name}."
             )
             print(msg)
 
     def remove_labelset(self, label_name, verbose=True):
-        self.data_loader.dataset.labels.pop(label_name)
+        self.data_loader.dataset.Y_dict.pop(label_name)
         task_name = self.labels_to_tasks[label_name]
         del self.labels_to_tasks[label_name]
 
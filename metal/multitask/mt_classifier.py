@@ -69,7 +69,7 @@ class MTClassifier(Classifier):
         Y_p = []
         for Y_ts in Y_s:
             Y_tp = self._break_ties(Y_ts, break_ties)
-            Y_p.append(Y_tp.astype(np.int))
+            Y_p.append(Y_tp.astype(int))
 
         if return_probs:
             return Y_p, Y_s
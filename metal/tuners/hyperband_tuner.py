@@ -196,7 +196,7 @@ class HyperbandTuner(ModelTuner):
         the train loop).
         """
         self._clear_state(seed)
-        self.search_space = search_space
+        self._set_search_space(search_space)
 
         # Loop over each bracket
         n_models_scored = 0
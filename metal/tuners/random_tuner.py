@@ -1,6 +1,35 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import cycle, islice
+
+import torch
+
 from metal.tuners.tuner import ModelTuner
 
 
+def _init_search_worker(device_queue):
+    """Pins each worker process to its own cuda device
+
+    Each worker pops a distinct device id off the queue and exposes only that
+    device, so parallel trials on a multi-gpu machine train on separate gpus.
+    """
+    if device_queue is not None:
+        os.environ["CUDA_VISIBLE_DEVICES"] = str(device_queue.get())
+
+
+def _run_search_trial(tuner, idx, config, valid_data, trial_kwargs):
+    """Evaluates a single config in a worker process
+
+    The tuner is a pickled copy, so state mutated here does not propagate back
+    to the parent; the model is saved under a trial-specific path and the
+    parent performs the best-model reduction from the returned values.
+    """
+    tuner.save_path = os.path.join(tuner.log_subdir, f"model_{idx}.pkl")
+    score, model = tuner._test_model_config(idx, config, valid_data, **trial_kwargs)
+    return idx, config, score, tuner.save_path, tuner.run_stats[-1]
+
+
 class RandomSearchTuner(ModelTuner):
     """A tuner for models
 
@@ -26,6 +55,7 @@ class RandomSearchTuner(ModelTuner):
         verbose=True,
         clean_up=True,
         seed=None,
+        max_workers=1,
         **score_kwargs,
     ):
         """
@@ -41,6 +71,10 @@ class RandomSearchTuner(ModelTuner):
             module_kwargs: (dict) Dictionary of dictionaries of module kwargs
             max_search: see config_generator() documentation
             shuffle: see config_generator() documentation
+            max_workers: (int) if > 1, evaluate up to max_workers configs
+                concurrently in separate processes (one per gpu when cuda is
+                available); configs are independent, so search wall-clock
+                scales roughly linearly with max_workers
 
         Returns:
             best_model: the highest performing trained model
@@ -51,26 +85,30 @@ class RandomSearchTuner(ModelTuner):
         the train loop).
         """
         self._clear_state(seed)
-        self.search_space = search_space
+        self._set_search_space(search_space)
 
         # Generate configs
         configs = self.config_generator(search_space, max_search, self.rng, shuffle)
 
+        trial_kwargs = dict(
+            init_args=init_args,
+            train_args=train_args,
+            init_kwargs=init_kwargs,
+            train_kwargs=train_kwargs,
+            module_args=module_args,
+            module_kwargs=module_kwargs,
+            verbose=verbose,
+            **score_kwargs,
+        )
+
         # Commence search
-        for i, config in enumerate(configs):
-            score, model = self._test_model_config(
-                i,
-                config,
-                valid_data,
-                init_args=init_args,
-                train_args=train_args,
-                init_kwargs=init_kwargs,
-                train_kwargs=train_kwargs,
-                module_args=module_args,
-                module_kwargs=module_kwargs,
-                verbose=verbose,
-                **score_kwargs,
-            )
+        if max_workers > 1:
+            self._search_parallel(configs, valid_data, trial_kwargs, max_workers)
+        else:
+            for i, config in enumerate(configs):
+                score, model = self._test_model_config(
+                    i, config, valid_data, **trial_kwargs
+                )
 
         if verbose:
             print("=" * 60)
@@ -84,3 +122,52 @@ class RandomSearchTuner(ModelTuner):
 
         # Return best model
         return self._load_best_model(clean_up=clean_up)
+
+    def _search_parallel(self, configs, valid_data, trial_kwargs, max_workers):
+        """Evaluates configs concurrently in a pool of worker processes
+
+        Each worker saves its trained model under a trial-specific path; the
+        best-model reduction happens here as results complete, after which the
+        winning model is promoted to self.save_path and the rest are removed.
+        """
+        # Use spawn so workers get a fresh cuda context (forked children
+        # cannot re-initialize cuda if the parent already has)
+        mp_context = multiprocessing.get_context("spawn")
+
+        # Hand out one device id per worker, round-robin over available gpus
+        device_queue = None
+        if torch.cuda.is_available():
+            device_queue = multiprocessing.Manager().Queue()
+            for device in islice(cycle(range(torch.cuda.device_count())), max_workers):
+                device_queue.put(device)
+
+        best_model_path = None
+        model_paths = []
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_search_worker,
+            initargs=(device_queue,),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _run_search_trial, self, i, config, valid_data, trial_kwargs
+                )
+                for i, config in enumerate(configs)
+            ]
+            for future in as_completed(futures):
+                idx, config, score, model_path, run_stats = future.result()
+                self.run_stats.append(run_stats)
+                model_paths.append(model_path)
+                if self.best_score is None or score > self.best_score:
+                    self.best_score = score
+                    self.best_index = idx
+                    self.best_config = config
+                    best_model_path = model_path
+
+        # Promote the best trial's model and clean up the others
+        for model_path in model_paths:
+            if model_path == best_model_path:
+                os.replace(model_path, self.save_path)
+            elif os.path.exists(model_path):
+                os.remove(model_path)
@@ -80,11 +80,14 @@ class ModelTuner(object):
         self.start_time = time()
         self.run_stats = []
         self.best_index = -1
-        self.best_score = -1
+        # None (rather than a numeric sentinel) so that the first score always
+        # wins, even for metrics that can be <= the sentinel value
+        self.best_score = None
         self.best_config = None
 
         # Note: These must be set at the start of self.search()
         self.search_space = None
+        self._searched_params = None
 
         # Reset the seed
         if seed is not None:
@@ -131,12 +134,8 @@ class ModelTuner(object):
         model = self.model_class(*init_args, **init_kwargs)
 
         # Search params
-        # Select any params in search space that have list or dict
-        search_params = {}
-        for k, v in config.items():
-            if k in self.search_space.keys():
-                if isinstance(self.search_space[k], (list, dict)):
-                    search_params[k] = v
+        # Select any params in config that are being searched over
+        search_params = {k: v for k, v in config.items() if k in self._searched_params}
 
         if verbose:
             print("=" * 60)
@@ -169,7 +168,7 @@ class ModelTuner(object):
         )
 
         # If score better than best_score, save
-        if score > self.best_score:
+        if self.best_score is None or score > self.best_score:
             self.best_score = score
             self.best_index = idx
             self.best_config = config
@@ -187,6 +186,18 @@ class ModelTuner(object):
         )
         return score, model
 
+    def _set_search_space(self, search_space):
+        """Stores the search space, classifying once which params are searched
+
+        A param is searched if it maps to multiple candidate values (a list or
+        a range dict), so the per-trial loops only pay one set-membership test
+        per key instead of re-inspecting the search space every trial.
+        """
+        self.search_space = search_space
+        self._searched_params = {
+            k for k, v in search_space.items() if isinstance(v, (list, dict))
+        }
+
     def _save_best_model(self, model):
         with open(self.save_path, "wb") as f:
             pickle.dump(model, f)
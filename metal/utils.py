@@ -494,11 +494,13 @@ def move_to_device(obj, device=-1):
     device = -1 -> "cpu"
     device =  0 -> "cuda:0"
 
+    Copies are made with non_blocking=True, so Tensors that live in pinned
+    memory are transferred asynchronously with respect to the host.
     """
     if device < 0 or not torch.cuda.is_available():
         return obj
     elif isinstance(obj, torch.Tensor):
-        return obj.cuda(device)
+        return obj.cuda(device, non_blocking=True)
     elif isinstance(obj, dict):
         return {key: move_to_device(value, device) for key, value in obj.items()}
     elif isinstance(obj, list):
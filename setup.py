@@ -48,7 +48,7 @@ setuptools.setup(
         "networkx>=2.2",
         "numpy",
         "pandas",
-        "torch>=1.0",
+        "torch>=1.7",
         "scipy",
         "tqdm",
         "scikit-learn",
@@ -12,6 +12,13 @@ from metal.mmtl.task import ClassificationTask
 from metal.mmtl.trainer import MultitaskTrainer
 from metal.utils import split_data
 
+try:
+    import numba  # noqa: F401
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 SPLITS = ["train", "valid", "test"]
 
 
@@ -59,6 +66,89 @@ def create_payloads(N, T, batch_size=1):
     return payloads
 
 
+class PayloadTest(unittest.TestCase):
+    @staticmethod
+    def _make_payload():
+        X = torch.arange(10, dtype=torch.float).view(10, 1)
+        Y = torch.ones(10, 1, dtype=torch.long)
+        return Payload.from_tensors("payload0", X, Y, "task0", "train")
+
+    def test_add_remove_labelset(self):
+        """Adding a labelset via each input type, then removing one"""
+        payload = self._make_payload()
+        X = payload.data_loader.dataset.X_dict["data"]
+        expected = (X > 4).long()
+
+        payload.add_labelset(
+            "task1",
+            "labelset1",
+            label_fn=lambda item: (item[0]["data"] > 4).long(),
+            verbose=False,
+        )
+        payload.add_labelset(
+            "task2",
+            "labelset2",
+            batched_label_fn=lambda dataset: (dataset.X_dict["data"] > 4).long(),
+            verbose=False,
+        )
+        payload.add_labelset("task3", "labelset3", label_list=expected, verbose=False)
+
+        Y_dict = payload.data_loader.dataset.Y_dict
+        for t in [1, 2, 3]:
+            self.assertTrue(torch.equal(Y_dict[f"labelset{t}"], expected))
+            self.assertEqual(payload.labels_to_tasks[f"labelset{t}"], f"task{t}")
+
+        payload.remove_labelset("labelset2", verbose=False)
+        self.assertNotIn("labelset2", Y_dict)
+        self.assertNotIn("labelset2", payload.labels_to_tasks)
+
+    @unittest.skipUnless(HAS_NUMBA, "numba is not installed")
+    def test_add_labelset_njit(self):
+        """Adding a labelset via a numba-compiled projection"""
+        from numba import njit
+
+        @njit
+        def threshold_label(X, i):
+            return (X[i] > 4).astype(np.int64)
+
+        payload = self._make_payload()
+        X = payload.data_loader.dataset.X_dict["data"]
+        expected = (X > 4).long()
+
+        payload.add_labelset(
+            "task1", "labelset1", njit_label_fn=threshold_label, verbose=False
+        )
+        self.assertTrue(
+            torch.equal(payload.data_loader.dataset.Y_dict["labelset1"], expected)
+        )
+
+        # An empty dataset has no first item to infer the label shape from
+        empty = Payload.from_tensors(
+            "empty",
+            torch.empty(0, 1),
+            torch.empty(0, 1, dtype=torch.long),
+            "task0",
+            "train",
+        )
+        with self.assertRaises(ValueError):
+            empty.add_labelset(
+                "task1", "labelset1", njit_label_fn=threshold_label, verbose=False
+            )
+
+    def test_add_labelset_ragged_labels(self):
+        """label_fns returning labels of non-uniform shape are rejected"""
+        payload = self._make_payload()
+        with self.assertRaises(ValueError):
+            payload.add_labelset(
+                "task1",
+                "labelset1",
+                label_fn=lambda item: torch.ones(
+                    int(item[0]["data"].item()) + 1, dtype=torch.long
+                ),
+                verbose=False,
+            )
+
+
 class MmtlTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
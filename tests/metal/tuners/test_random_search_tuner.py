@@ -1,4 +1,5 @@
 import json
+import os
 import unittest
 from shutil import rmtree
 
@@ -10,6 +11,23 @@ from metal.logging import LogWriter
 from metal.tuners.random_tuner import RandomSearchTuner
 
 
+class NegativeScoreModel:
+    """A minimal model whose validation scores are all negative
+
+    Stands in for models tuned on metrics like log-likelihood, where every
+    score is below any numeric "unset" sentinel.
+    """
+
+    def __init__(self, loss=1.0, verbose=False, **kwargs):
+        self.loss = loss
+
+    def train_model(self, *args, **kwargs):
+        pass
+
+    def score(self, valid_data, metric="accuracy", verbose=False, **kwargs):
+        return -self.loss
+
+
 class RandomSearchModelTunerTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -121,6 +139,65 @@ class RandomSearchModelTunerTest(unittest.TestCase):
         # Clean up
         rmtree(tuner.log_rootdir)
 
+    def test_tuner_negative_scores(self):
+        # Every trial scores below -1, which the old best_score = -1 sentinel
+        # treated as never-best (so no best model was ever saved)
+        tuner = RandomSearchTuner(NegativeScoreModel, seed=123)
+        best_model = tuner.search({"loss": [3.0, 2.0, 4.0]}, None, verbose=False)
+
+        self.assertEqual(tuner.best_score, -2.0)
+        self.assertNotEqual(tuner.best_index, -1)
+        self.assertEqual(tuner.best_config["loss"], 2.0)
+        self.assertEqual(best_model.loss, 2.0)
+
+        # Clean up
+        rmtree(tuner.log_rootdir)
+
+    def test_tuner_parallel(self):
+        Xs, Ys = self.single_problem
+
+        # Set up RandomSearchTuner
+        tuner = RandomSearchTuner(EndModel, log_writer_class=LogWriter)
+
+        # Run the search with two worker processes
+        init_kwargs = {
+            "seed": 1,
+            "input_batchnorm": False,
+            "middle_batchnorm": False,
+            "layer_out_dims": [2, 10, 2],
+            "verbose": False,
+            "checkpoint": False,
+        }
+        search_space = {"middle_dropout": [0.0, 1.0]}
+        best_model = tuner.search(
+            search_space,
+            (Xs[1], Ys[1]),
+            init_kwargs=init_kwargs,
+            train_args=[(Xs[0], Ys[0])],
+            train_kwargs={"n_epochs": 10},
+            verbose=False,
+            max_workers=2,
+            clean_up=False,
+        )
+
+        # One run_stats entry per trial, and the winning (no-dropout) model
+        self.assertEqual(len(tuner.run_stats), 2)
+        self.assertGreater(tuner.best_score, 0.9)
+        self.assertIsNotNone(best_model)
+
+        # The best model was promoted to save_path and the per-trial models
+        # were cleaned up
+        self.assertTrue(os.path.exists(tuner.save_path))
+        leftovers = [
+            f
+            for f in os.listdir(tuner.log_subdir)
+            if f.startswith("model_") and f.endswith(".pkl")
+        ]
+        self.assertEqual(leftovers, [])
+
+        # Clean up
+        rmtree(tuner.log_rootdir)
+
 
 if __name__ == "__main__":
     unittest.main()